@@ -101,6 +101,34 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# 'book_list' holds the cached book list pages; it is cleared whenever a book changes
+# (local memory is per process, so other workers may serve a page for up to the view's timeout)
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'book_list': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'book-list',
+    },
+}
+
+# Login rate-limit counters: shared Redis when REDIS_URL is set (requires the redis package),
+# otherwise process-local memory. Either way a check is one cache hit, never a database query.
+REDIS_URL = os.getenv('REDIS_URL')
+CACHES['ratelimit'] = {
+    'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+    'LOCATION': REDIS_URL,
+} if REDIS_URL else {
+    'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    'LOCATION': 'ratelimit',
+}
+RATELIMIT_USE_CACHE = 'ratelimit'
+
+
 # Password validation
 ###############################################################
 # HTTPS & Security Settings
@@ -175,6 +203,10 @@ LOGIN_URL = 'login'  # Where to redirect when @login_required fails
 LOGIN_REDIRECT_URL = 'book_list'  # Where to go after successful login
 LOGOUT_REDIRECT_URL = 'login'  # Where to go after logout
 
+# Flash messages ride in a signed cookie, so create/edit/delete POSTs never write them to the session.
+# The bookshelf messages are short one-liners, well under the ~4KB cookie limit.
+MESSAGE_STORAGE = 'django.contrib.messages.storage.cookie.CookieStorage'
+
 # Secure settings
 """Enables the browser's built-in XSS (Cross-Site Scripting) filter. When set to True, it adds the
 X-XSS-Protection: 1; mode=block header to HTTP responses, which instructs compatible browsers to block the page if an XSS attack is detected."""
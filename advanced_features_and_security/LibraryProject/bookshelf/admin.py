@@ -1,7 +1,11 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
+from django.contrib.auth.models import Permission
+from django.core.exceptions import ValidationError
+from django.db.models import Prefetch
 from .models import CustomUser, Book
 # Register your models here.
+@admin.register(Book)
 class BookAdmin(admin.ModelAdmin):
     list_display = ('title', 'author', 'publication_year')
 
@@ -13,14 +17,13 @@ class BookAdmin(admin.ModelAdmin):
 
 
 
-# Register your model with the custom ModelAdmin class
-admin.site.register(Book, BookAdmin)
 admin.site.site_header = "Library Project Admin"
 admin.site.site_title = "Library Project Admin Portal"
 admin.site.index_title = "Welcome to the Library Project Admin Portal"
 
 
 # Custom UserAdmin to display custom fields
+@admin.register(CustomUser)
 class CustomUserAdmin(UserAdmin):
     """
     Custom admin configuration for CustomUser model.
@@ -51,6 +54,7 @@ class CustomUserAdmin(UserAdmin):
         'first_name', 
         'last_name', 
         'date_of_birth', 
+        'age',
         'is_staff',
         'is_active',
         'date_joined'
@@ -82,9 +86,42 @@ class CustomUserAdmin(UserAdmin):
     # Add pagination - show 25 users per page
     list_per_page = 25
     
-    # Show user count at the top
-    show_full_result_count = True
+    # Skip the extra unfiltered COUNT(*) on filtered list views ("5 results (Show all)" instead of "5 of N")
+    show_full_result_count = False
 
+    def get_queryset(self, request):
+        """
+        Only load the columns shown in the list view, with age computed in SQL.
+        profile_photo and password are never displayed here, so they stay out of the SELECT.
+        """
+        return super().get_queryset(request).with_age().only(
+            'id',
+            'username',
+            'email',
+            'first_name',
+            'last_name',
+            'date_of_birth',
+            'is_staff',
+            'is_active',
+            'date_joined',
+        )
 
-# Register CustomUser model with CustomUserAdmin
-admin.site.register(CustomUser, CustomUserAdmin)
\ No newline at end of file
+    @admin.display(description='Age', ordering='age')
+    def age(self, obj):
+        return obj.age
+
+    def get_object(self, request, object_id, from_field=None):
+        """
+        The change view renders every field plus the groups and user_permissions widgets,
+        so load the full row and prefetch both relations (with each permission's content type).
+        """
+        queryset = self.get_queryset(request).defer(None).prefetch_related(
+            'groups',
+            Prefetch('user_permissions', queryset=Permission.objects.select_related('content_type')),
+        )
+        field = self.model._meta.pk if from_field is None else self.model._meta.get_field(from_field)
+        try:
+            object_id = field.to_python(object_id)
+            return queryset.get(**{field.name: object_id})
+        except (self.model.DoesNotExist, ValidationError, ValueError):
+            return None
@@ -12,6 +12,20 @@ class BookForm(forms.ModelForm):
     ModelForm for creating and editing books.
     Provides built-in validation and rendering.
     """
+
+    # Declared explicitly so Django's Min/MaxValueValidator enforce the year range
+    # (min_value/max_value also render the min/max attributes on the input)
+    publication_year = forms.IntegerField(
+        min_value=1000,
+        max_value=2100,
+        label='Publication Year',
+        help_text='Enter a year between 1000 and 2100',
+        widget=forms.NumberInput(attrs={
+            'class': 'form-control',
+            'placeholder': 'Enter publication year (e.g., 2024)',
+            'required': True
+        }),
+    )
     
     class Meta:
         model = Book
@@ -29,50 +43,23 @@ class BookForm(forms.ModelForm):
                 'placeholder': 'Enter author name',
                 'required': True
             }),
-            'publication_year': forms.NumberInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'Enter publication year (e.g., 2024)',
-                'min': 1000,
-                'max': 2100,
-                'required': True
-            }),
         }
         
         # Custom labels
         labels = {
             'title': 'Book Title',
             'author': 'Author Name',
-            'publication_year': 'Publication Year',
-        }
-        
-        # Help text
-        help_texts = {
-            'publication_year': 'Enter a year between 1000 and 2100',
         }
     
-    def clean_publication_year(self):
-        """
-        Custom validation for publication year.
-        Ensures the year is reasonable.
-        """
-        year = self.cleaned_data.get('publication_year')
-        
-        if year:
-            if year < 1000:
-                raise forms.ValidationError('Publication year must be after year 1000.')
-            if year > 2100:
-                raise forms.ValidationError('Publication year cannot be in the distant future.')
-        
-        return year
-    
-    def clean_title(self):
+    def clean(self):
         """
         Custom validation for title.
-        Ensures title is not too short.
+        Ensures title is not too short (the year range is handled by the field's validators).
         """
-        title = self.cleaned_data.get('title')
-        
+        cleaned_data = super().clean()
+        title = cleaned_data.get('title')
+
         if title and len(title) < 2:
-            raise forms.ValidationError('Book title must be at least 2 characters long.')
-        
-        return title
+            self.add_error('title', 'Book title must be at least 2 characters long.')
+
+        return cleaned_data
@@ -1,6 +1,7 @@
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.contrib.auth.models import Group, Permission
 from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
 from bookshelf.models import Book
 
 
@@ -8,44 +9,61 @@ class Command(BaseCommand):
     help = 'Create user groups and assign permissions'
 
     def handle(self, *args, **kwargs):
-        # Get content type for Book model
-        book_content_type = ContentType.objects.get_for_model(Book)
-
-        # Get custom permissions defined in Book model
-        can_view = Permission.objects.get(codename='can_view', content_type=book_content_type)
-        can_create = Permission.objects.get(codename='can_create', content_type=book_content_type)
-        can_edit = Permission.objects.get(codename='can_edit', content_type=book_content_type)
-        can_delete = Permission.objects.get(codename='can_delete', content_type=book_content_type)
-
-        # Create groups
-        viewers, created = Group.objects.get_or_create(name='Viewers')
-        if created:
-            self.stdout.write(self.style.SUCCESS('Created group: Viewers'))
-        else:
-            self.stdout.write(self.style.WARNING('Group already exists: Viewers'))
-        
-        editors, created = Group.objects.get_or_create(name='Editors')
-        if created:
-            self.stdout.write(self.style.SUCCESS('Created group: Editors'))
-        else:
-            self.stdout.write(self.style.WARNING('Group already exists: Editors'))
-        
-        admins, created = Group.objects.get_or_create(name='Admins')
-        if created:
-            self.stdout.write(self.style.SUCCESS('Created group: Admins'))
-        else:
-            self.stdout.write(self.style.WARNING('Group already exists: Admins'))
-
-        # Assign permissions to Viewers (read-only)
-        viewers.permissions.set([can_view])
-        self.stdout.write(self.style.SUCCESS('Assigned permissions to Viewers: can_view'))
-
-        # Assign permissions to Editors (can view, add, change)
-        editors.permissions.set([can_view, can_create, can_edit])
-        self.stdout.write(self.style.SUCCESS('Assigned permissions to Editors: can_view, can_create, can_edit'))
-
-        # Assign permissions to Admins (all permissions)
-        admins.permissions.set([can_view, can_create, can_edit, can_delete])
-        self.stdout.write(self.style.SUCCESS('Assigned permissions to Admins: all book permissions'))
-
-        self.stdout.write(self.style.SUCCESS('✅ Successfully set up groups and permissions!'))
+        # Run everything in one transaction so the groups and their permissions commit together
+        with transaction.atomic():
+            # Get content types in one lookup (add further models to this call as the command grows)
+            book_content_type = ContentType.objects.get_for_models(Book)[Book]
+
+            # Get custom permissions defined in Book model in a single query
+            codenames = ['can_view', 'can_create', 'can_edit', 'can_delete']
+            perms = {
+                perm.codename: perm
+                for perm in Permission.objects.filter(content_type=book_content_type, codename__in=codenames)
+            }
+            missing = [codename for codename in codenames if codename not in perms]
+            if missing:
+                raise CommandError(f"Missing permissions {', '.join(missing)}. Run 'migrate' first.")
+            can_view = perms['can_view']
+            can_create = perms['can_create']
+            can_edit = perms['can_edit']
+            can_delete = perms['can_delete']
+
+            # Create the missing groups in one INSERT, then load all of them by name
+            group_names = ['Viewers', 'Editors', 'Admins']
+            groups = Group.objects.in_bulk(group_names, field_name='name')
+            missing_groups = [name for name in group_names if name not in groups]
+            if missing_groups:
+                Group.objects.bulk_create([Group(name=name) for name in missing_groups], ignore_conflicts=True)
+                groups = Group.objects.in_bulk(group_names, field_name='name')
+
+            for name in group_names:
+                if name in missing_groups:
+                    self.stdout.write(self.style.SUCCESS(f'Created group: {name}'))
+                else:
+                    self.stdout.write(self.style.WARNING(f'Group already exists: {name}'))
+
+            # Viewers are read-only, Editors can view/add/change, Admins get all book permissions
+            group_permissions = {
+                'Viewers': [can_view],
+                'Editors': [can_view, can_create, can_edit],
+                'Admins': [can_view, can_create, can_edit, can_delete],
+            }
+
+            # Replace the groups' permissions with one DELETE and one multi-row INSERT
+            # on the through table instead of a set() call per group
+            GroupPermission = Group.permissions.through
+            GroupPermission.objects.filter(group__in=groups.values()).delete()
+            GroupPermission.objects.bulk_create(
+                [
+                    GroupPermission(group_id=groups[name].id, permission_id=perm.id)
+                    for name, group_perms in group_permissions.items()
+                    for perm in group_perms
+                ],
+                batch_size=500,
+                ignore_conflicts=True,
+            )
+            self.stdout.write(self.style.SUCCESS('Assigned permissions to Viewers: can_view'))
+            self.stdout.write(self.style.SUCCESS('Assigned permissions to Editors: can_view, can_create, can_edit'))
+            self.stdout.write(self.style.SUCCESS('Assigned permissions to Admins: all book permissions'))
+
+            self.stdout.write(self.style.SUCCESS('✅ Successfully set up groups and permissions!'))
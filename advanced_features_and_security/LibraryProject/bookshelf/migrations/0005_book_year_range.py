@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 04:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookshelf', '0004_book_indexes'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='book',
+            constraint=models.CheckConstraint(condition=models.Q(('publication_year__gte', 1000), ('publication_year__lte', 2100)), name='book_year_range', violation_error_message='Publication year must be between 1000 and 2100.'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-15 04:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('bookshelf', '0005_book_year_range'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(fields=['-date_joined'], name='bookshelf_c_date_jo_cc4965_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(fields=['is_active', '-date_joined'], name='bookshelf_c_is_acti_ff3fff_idx'),
+        ),
+    ]
@@ -1,18 +1,19 @@
+from datetime import date
+from functools import cached_property
+
+from django.core.cache import caches
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.db.models.functions import ExtractYear
 from django.contrib.auth.models import AbstractUser, BaseUserManager
-from django.forms import ValidationError
 
 
 class Book(models.Model):
-    title = models.CharField(max_length=200)
+    title = models.CharField(max_length=200, db_index=True)
     author = models.CharField(max_length=100)
     publication_year = models.IntegerField()
 
-    def clean(self):
-        # Custom validation logic can be added here
-        if self.publication_year < 0 or self.publication_year > 2100:
-            raise ValidationError('Publication year must be between 0 and 2100.')
-
     class Meta:
         permissions = [
             ("can_view", "Can view book"),
@@ -20,12 +21,52 @@ class Book(models.Model):
             ("can_edit", "Can edit book"),
             ("can_delete", "Can delete book"),
         ]
+        # Indexes backing the admin list_filter / search_fields lookups
+        # (the composite index also serves author-only filters)
+        indexes = [
+            models.Index(fields=['publication_year']),
+            models.Index(fields=['author', 'publication_year']),
+        ]
+        # The database enforces the year range; ModelForms also validate it via full_clean()
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(publication_year__gte=1000) & models.Q(publication_year__lte=2100),
+                name='book_year_range',
+                violation_error_message='Publication year must be between 1000 and 2100.',
+            ),
+        ]
 
     def __str__(self):
         return self.title
+
+
+# Drop the cached book list pages whenever a book is added, edited or deleted
+@receiver(post_save, sender=Book)
+@receiver(post_delete, sender=Book)
+def clear_book_list_cache(sender, **kwargs):
+    caches['book_list'].clear()
     
+# custom queryset so query methods can be chained onto any user queryset (e.g. in the admin)
+class CustomUserQuerySet(models.QuerySet):
+    def with_age(self):
+        """Annotate each user with their age in whole years, computed by the database"""
+        today = date.today()
+        # 1 if this year's birthday is still ahead, 0 otherwise
+        birthday_pending = models.Case(
+            models.When(
+                models.Q(date_of_birth__month__gt=today.month)
+                | models.Q(date_of_birth__month=today.month, date_of_birth__day__gt=today.day),
+                then=models.Value(1),
+            ),
+            default=models.Value(0),
+        )
+        return self.annotate(
+            age=models.Value(today.year) - ExtractYear('date_of_birth') - birthday_pending
+        )
+
+
 # to create a custom user manager
-class CustomUserManager(BaseUserManager):
+class CustomUserManager(BaseUserManager.from_queryset(CustomUserQuerySet)):
     # Manager methods - CREATE or QUERY multiple users
     def create_user(self, username, email=None, password=None, **extra_fields):
         """Factory method to CREATE a new user"""
@@ -76,15 +117,27 @@ class CustomUser(AbstractUser):
     # Attach the custom manager (CRITICAL!)
     objects = CustomUserManager()
 
+    class Meta(AbstractUser.Meta):
+        # The admin lists users newest first (optionally filtered by is_active),
+        # so these let the database read rows in index order instead of sorting
+        indexes = [
+            models.Index(fields=['-date_joined']),
+            models.Index(fields=['is_active', '-date_joined']),
+        ]
+
+    # computed once per instance, so templates/admin rows calling it repeatedly don't redo the date math
+    @cached_property
+    def age(self):
+        """Return the user's age in whole years, or None if date_of_birth is not set"""
+        if not self.date_of_birth:
+            return None
+        today = date.today()
+        dob = self.date_of_birth
+        return today.year - dob.year - ((today.month, today.day) < (dob.month, dob.day))
+
     # can create instance methods which operate on a SINGLE user instance
     def get_age(self):
-        from datetime import date
-        if self.date_of_birth:
-            today = date.today()
-            # age = today.year - self.date_of_birth.year - ((today.month, today.day) < (self.date_of_birth.month, self.date_of_birth.day))
-            
-            return (date.today() - self.date_of_birth).days // 365
-        return None
+        return self.age
     
     # instance method 
     def update_profile_photo(self, new_photo):
@@ -92,11 +145,15 @@ class CustomUser(AbstractUser):
         self.profile_photo = new_photo
         self.save()
 
-    def get_full_display_name(self):
-        """Return the user's full name in a display format"""
+    @cached_property
+    def display_name(self):
+        """Return the user's full name in a display format, built once per instance"""
         if self.first_name and self.last_name:
             return f"{self.first_name} {self.last_name} (@{self.username})"
         return self.username
+
+    def get_full_display_name(self):
+        return self.display_name
     
     # this is a string representation method
     def __str__(self):
@@ -2,10 +2,16 @@ from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required, permission_required
 from django.contrib.auth import authenticate, login, logout
 from django.contrib import messages
+from django.utils.translation import gettext as _
+from django.views.decorators.cache import cache_page, never_cache
+from django.views.decorators.vary import vary_on_cookie
 from .models import Book
 from .forms import ExampleForm, BookForm 
 from ratelimit.decorators import ratelimit
 
+# Content-Security-Policy sent with the login page (built once at import time)
+CSP_HEADER = "default-src 'self'; script-src 'self'; style-src 'self' 'unsafe-inline'; img-src 'self' data:; font-src 'self';"
+
 
 @ratelimit(key='ip', rate='5/m', block=True)
 def user_login(request):
@@ -20,28 +26,32 @@ def user_login(request):
             next_url = request.POST.get('next') or request.GET.get('next') or 'book_list'
             return redirect(next_url)
         else:
-            messages.error(request, 'Invalid username or password.')
+            messages.error(request, _('Invalid username or password.'))
         response = render(request, 'login.html')
-        response["Content-Security-Policy"] = "default-src 'self'; script-src 'self'; style-src 'self' 'unsafe-inline'; img-src 'self' data:; font-src 'self';"
+        response["Content-Security-Policy"] = CSP_HEADER
         return response
     else:
         response = render(request, 'login.html')
-        response["Content-Security-Policy"] = "default-src 'self'; script-src 'self'; style-src 'self' 'unsafe-inline'; img-src 'self' data:; font-src 'self';"
+        response["Content-Security-Policy"] = CSP_HEADER
         return response
 
 
 def user_logout(request):
     """Logout view"""
     logout(request)
-    messages.success(request, 'You have been logged out successfully.')
+    messages.success(request, _('You have been logged out successfully.'))
     return redirect('login')
 
 
 @login_required
 @permission_required('bookshelf.can_view', raise_exception=True)
+@never_cache  # cached on the server only: the browser must not reuse a stale list after a change
+@cache_page(60, cache='book_list')
+@vary_on_cookie  # the page is per user (permissions, messages), so key the cache on the session cookie
 def book_list(request):
     """Display list of all books - requires can_view permission"""
-    books = Book.objects.all().order_by('-publication_year', 'title')
+    # read-only page: plain dicts skip model instantiation (the template only uses these keys)
+    books = Book.objects.order_by('-publication_year', 'title').values('id', 'title', 'author', 'publication_year')
     # even though the html files are under bookshelf/templates we only need to specify 'bookshelf/book_list.html'
     return render(request, 'book_list.html', {'books': books})
 
@@ -54,10 +64,10 @@ def book_create(request):
         form = BookForm(request.POST)
         if form.is_valid():
             book = form.save()
-            messages.success(request, f'Book "{book.title}" has been added successfully!')
+            messages.success(request, _('Book "%(title)s" has been added successfully!') % {'title': book.title})
             return redirect('book_list')
         else:
-            messages.error(request, 'Please correct the errors below.')
+            messages.error(request, _('Please correct the errors below.'))
     else:
         form = BookForm()
     
@@ -75,10 +85,10 @@ def book_edit(request, pk):
         form = BookForm(request.POST, instance=book)
         if form.is_valid():
             book = form.save()
-            messages.success(request, f'Book "{book.title}" has been updated successfully!')
+            messages.success(request, _('Book "%(title)s" has been updated successfully!') % {'title': book.title})
             return redirect('book_list')
         else:
-            messages.error(request, 'Please correct the errors below.')
+            messages.error(request, _('Please correct the errors below.'))
     else:
         form = BookForm(instance=book)
     
@@ -94,7 +104,7 @@ def book_delete(request, pk):
     if request.method == 'POST':
         title = book.title
         book.delete()
-        messages.success(request, f'Book "{title}" has been deleted successfully!')
+        messages.success(request, _('Book "%(title)s" has been deleted successfully!') % {'title': title})
         return redirect('book_list')
     
     return render(request, 'delete_book.html', {'book': book})
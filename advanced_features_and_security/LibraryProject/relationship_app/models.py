@@ -1,4 +1,7 @@
+from django.core.cache import caches
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 # Create your models here.
 
@@ -16,6 +19,15 @@ class Book(models.Model):
     def __str__(self):
         return self.title
     
+
+# The cached book list renders titles and author names, so drop it when either changes
+@receiver(post_save, sender=Author)
+@receiver(post_delete, sender=Author)
+@receiver(post_save, sender=Book)
+@receiver(post_delete, sender=Book)
+def clear_book_list_cache(sender, **kwargs):
+    caches['book_list'].clear()
+
 class Library(models.Model):
     name = models.CharField(max_length=200)
     books = models.ManyToManyField(Book, related_name='libraries')
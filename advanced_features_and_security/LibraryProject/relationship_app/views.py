@@ -1,23 +1,25 @@
-from django.shortcuts import render
+from django.views import View
+from django.shortcuts import render, get_object_or_404
+from django.db.models import Prefetch
+from django.views.decorators.cache import cache_page, never_cache
+from .models import Library, Librarian, Book 
 
 # Create your views here.
 
 # Create a function-based view in relationship_app/views.py that lists all books stored in the database.
 # This view should render a simple text list of book titles and their authors.
 
+@never_cache  # cached on the server only: the browser must not reuse a stale list after a change
+@cache_page(60, cache='book_list')
 def book_list(request):
-    from .models import Book  # Importing here to avoid circular imports
-    books = Book.objects.all()
-    output = ', '.join([f"{book.title} by {book.author.name}" for book in books])
+    # One JOINed query streaming (title, author name) tuples; no Book/Author objects are built
+    pairs = Book.objects.values_list('title', 'author__name')
+    output = ', '.join(f"{title} by {author_name}" for title, author_name in pairs.iterator(chunk_size=2000))
     return render(request, 'relationship_app/book_list.html', {'output': output})
 
 # create a class-based view in relationship_app/views.py that displays details of a specific library, listing all books available in that library along with the librarian's name.
 
 
-
-from django.views import View
-from django.shortcuts import render, get_object_or_404
-from .models import Library, Librarian, Book 
 class LibraryDetailView(View):
     """
     A Class-Based View for displaying library details, 
@@ -28,13 +30,16 @@ class LibraryDetailView(View):
     # It takes 'request' and 'library_id' (from the URL) as arguments.
     def get(self, request, library_id):
         
-        # 1. Fetch the main Library object (The exact same FBV logic)
-        library = get_object_or_404(Library, id=library_id)
+        # 1. Fetch the main Library object, JOINing the librarian and prefetching the books with their authors
+        queryset = Library.objects.select_related('librarian').prefetch_related(
+            Prefetch('books', queryset=Book.objects.select_related('author').only('title', 'author__name'))
+        )
+        library = get_object_or_404(queryset, id=library_id)
         
-        # 2. Fetch the related books using the ManyToMany relationship
+        # 2. The related books are already prefetched, so this doesn't hit the database
         books = library.books.all()
         
-        # 3. Fetch the related Librarian using the OneToOne relationship
+        # 3. The related Librarian was loaded by select_related (raises DoesNotExist if there is none)
         try:
             librarian_info = library.librarian
         except Librarian.DoesNotExist:
@@ -4,4 +4,4 @@ class BookSerializer(serializers.ModelSerializer):
     author = serializers.ReadOnlyField(source='author.username')
     class Meta: 
         model = Book
-        fields = '__all__'
\ No newline at end of file
+        fields = ('id', 'title', 'author')
\ No newline at end of file
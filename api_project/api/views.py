@@ -14,11 +14,14 @@ from rest_framework import status
 # and the parent class handles the rest.
 
 class BookList(generics.ListAPIView):
-    # The queryset attribute tells the view what data to retrieve.
-    queryset = Book.objects.all()
     # The serializer_class attribute tells the view how to format the data.
     serializer_class = BookSerializer
 
+    # get_queryset tells the view what data to retrieve: the author is JOINed and only
+    # the columns the serializer reads are selected (no password/email from auth_user)
+    def get_queryset(self):
+        return Book.objects.select_related('author').only('id', 'title', 'author__username')
+
 
 # Creating a viewset
 class BookViewSet(viewsets.ModelViewSet):
@@ -30,6 +33,10 @@ class BookViewSet(viewsets.ModelViewSet):
     queryset = Book.objects.all()
     serializer_class = BookSerializer
 
+    def get_queryset(self):
+        # Same JOIN/column trimming as BookList, so listing books doesn't query each author
+        return Book.objects.select_related('author').only('id', 'title', 'author__username')
+
     # Allows GET, HEAD, OPTIONS requests for unauthenticated users,
     # but requires authentication for POST, PUT, PATCH, and DELETE.
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
@@ -46,9 +53,9 @@ class BookListView(APIView):
 
     def get(self, request):
         # Only authenticated users can access this view
-        queryset = Book.objects.all()
-        BookSerializer = BookSerializer(queryset, many=True)
-        return Response(BookSerializer.data)
+        queryset = Book.objects.select_related('author').only('id', 'title', 'author__username')
+        serializer = BookSerializer(queryset, many=True)
+        return Response(serializer.data)
         # return Response({'message': 'Hello, authenticated user!'})
 
 # class BookListCreateView(APIView):
@@ -3,14 +3,20 @@
 # List all books in a library.
 # Retrieve the librarian for a library.
 
+from collections import defaultdict
+
 from relationship_app.models import Author, Book, Library, Librarian
 def get_books_by_author(author_name):
-    try:
-        author = Author.objects.get(name=author_name)
-        books = Book.objects.filter(author=author) 
-        return books
-    except Author.DoesNotExist:
-        return None
+    # one query: the author name is matched through the JOIN (empty queryset if the author doesn't exist)
+    return Book.objects.filter(author__name=author_name).select_related('author')
+def get_books_by_authors(author_names):
+    # bulk variant for looking up many authors: one query for all of them, grouped in Python
+    # returns {author_name: [Book, ...]}; authors without books are left out
+    books_by_author = defaultdict(list)
+    books = Book.objects.filter(author__name__in=author_names).select_related('author')
+    for book in books.iterator(chunk_size=1000):
+        books_by_author[book.author.name].append(book)
+    return dict(books_by_author)
 def get_books_in_library(library_name):
     try:
         library = Library.objects.get(name=library_name)
@@ -19,11 +25,8 @@ def get_books_in_library(library_name):
     except Library.DoesNotExist:
         return None
 def get_librarian_for_library(library_name):
+    # one query: the library is JOINed instead of being fetched separately
     try:
-        library = Library.objects.get(name=library_name)
-        librarian = Librarian.objects.get(library=library.pk)
-        return librarian
-    except Library.DoesNotExist:
-        return None
+        return Librarian.objects.select_related('library').get(library__name=library_name)
     except Librarian.DoesNotExist:
-        return None
\ No newline at end of file
+        return None
@@ -1,18 +1,22 @@
 from django.views import View
 from django.shortcuts import render, get_object_or_404
+from django.db.models import Prefetch
 from .models import Library, Librarian, Book 
 from django.views.generic.detail import DetailView
 from django.views.generic.list import ListView
+from django.views.decorators.cache import cache_page, never_cache
 
 # Create your views here.
 
 # Create a function-based view in relationship_app/views.py that lists all books stored in the database.
 # This view should render a simple text list of book titles and their authors.
 
+@never_cache  # cached on the server only: the browser must not reuse a stale list after a change
+@cache_page(60, cache='book_list')
 def list_books(request):
-    from .models import Book  # Importing here to avoid circular imports
-    books = Book.objects.all()
-    output = ', '.join([f"{book.title} by {book.author.name}" for book in books])
+    # One JOINed query streaming (title, author name) tuples; no Book/Author objects are built
+    pairs = Book.objects.values_list('title', 'author__name')
+    output = ', '.join(f"{title} by {author_name}" for title, author_name in pairs.iterator(chunk_size=2000))
     return render(request, 'relationship_app/list_books.html', {'output': output})
 
 # create a class-based view in relationship_app/views.py that displays details of a specific library, listing all books available in that library along with the librarian's name.
@@ -25,9 +29,15 @@ class LibraryDetailView(DetailView):
     template_name = 'relationship_app/library_detail.html'
     context_object_name = 'library'
 
+    def get_queryset(self):
+        # librarian is JOINed and the books (with their authors) arrive in one extra IN query
+        return Library.objects.select_related('librarian').prefetch_related(
+            Prefetch('books', queryset=Book.objects.select_related('author').only('title', 'author__name'))
+        )
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        library = self.get_object()
+        library = self.object
         context['books_list'] = library.books.all()
         return context
     
@@ -37,6 +47,12 @@ class BookListView(ListView):
     model = Book 
     template_name = 'relationship_app/list_books.html'
     context_object_name = 'all_books'
+    # only one page of books is loaded per request, keeping memory flat for large catalogs
+    paginate_by = 50
+
+    def get_queryset(self):
+        # a stable ordering keeps pages from overlapping
+        return Book.objects.select_related('author').only('title', 'author__name').order_by('title')
 
 # Task2. Django Forms and Templates
 from django.contrib.auth.forms import UserCreationForm
@@ -1,6 +1,7 @@
 from django import forms
 from django.contrib.auth.forms import UserCreationForm
 from django.contrib.auth.models import User
+from django.core.files.uploadedfile import UploadedFile
 from .models import Profile, Post, Comment
 from taggit.forms import TagWidget
 
@@ -11,12 +12,10 @@ class CustomUserCreationForm(UserCreationForm):
         model = User
         fields = ("username", "email", "password1", "password2")
 
-    #  adding a layer of security to ensure email uniqueness
+    # emails are stored lowercased; uniqueness is enforced by the user_email_ci_unique index
+    # (an IntegrityError on save is turned into a form error by the register view)
     def clean_email(self):
-        email = self.cleaned_data.get('email')
-        if User.objects.filter(email=email).exists():
-            raise forms.ValidationError("Registration failed. Please check your details and try again.")
-        return email
+        return self.cleaned_data.get('email').strip().lower()
 
 class UserUpdateForm(forms.ModelForm):
     email = forms.EmailField(required=True)
@@ -24,15 +23,26 @@ class UserUpdateForm(forms.ModelForm):
         model = User
         fields = ["email"]
 
+    # keep stored emails lowercased, matching CustomUserCreationForm
+    def clean_email(self):
+        return self.cleaned_data.get('email').strip().lower()
+
+# leading bytes of the accepted profile picture formats: JPEG, PNG
+IMAGE_SIGNATURES = (b'\xff\xd8\xff', b'\x89PNG\r\n\x1a\n')
+
 class ProfileForm(forms.ModelForm):
     # adding a security layer to validate profile picture uploads
     #  didn't use FileExtensionValidator since it only checks extensions, not actual content type or size
+    # the Content-Type header is client-supplied, so the format is checked against the file's magic bytes
     def clean_profile_pic(self):
         profile_pic = self.cleaned_data.get('profile_pic')
-        if profile_pic:
+        # only a new upload needs checking; an unchanged picture is the already-stored file
+        if isinstance(profile_pic, UploadedFile):
             if profile_pic.size > 2 * 1024 * 1024:  # 2MB limit
                 raise forms.ValidationError("Profile picture size should not exceed 2MB.")
-            if not profile_pic.content_type in ['image/jpeg', 'image/png', 'image/jpg']:
+            head = profile_pic.read(12)
+            profile_pic.seek(0)
+            if not head.startswith(IMAGE_SIGNATURES):
                 raise forms.ValidationError("Only JPEG and PNG formats are supported.")
         return profile_pic
     
@@ -52,6 +62,7 @@ class PostForm(forms.ModelForm):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         # Always set initial tags as comma-separated string for both create and update
+        # (served from the prefetch cache when the view loaded the post with prefetch_related('tags'))
         tags_qs = self.instance.tags.all() if self.instance.pk else []
         self.fields['tags'].initial = ', '.join(tag.name for tag in tags_qs)
 
@@ -60,7 +71,14 @@ class PostForm(forms.ModelForm):
         tags = self.cleaned_data.get('tags')
         if commit:
             instance.save()
-            instance.tags.set(tags)
+            # only send the tags that changed: tags.set() looks up every tag (and fires
+            # m2m_changed) even when the edit left the tags alone
+            current = {tag.name for tag in instance.tags.all()}
+            desired = set(tags)
+            if current - desired:
+                instance.tags.remove(*(current - desired))
+            if desired - current:
+                instance.tags.add(*(desired - current))
         return instance
 
 # Comment form
@@ -0,0 +1,21 @@
+from django.conf import settings
+from django.db import migrations
+from django.db.models.functions import Lower, Trim
+
+
+def lowercase_emails(apps, schema_editor):
+    # registration and profile forms now store emails lowercased; bring existing accounts in line
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split('.'))
+    User.objects.update(email=Lower(Trim('email')))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0005_tag_post_tags'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(lowercase_emails, migrations.RunPython.noop),
+    ]
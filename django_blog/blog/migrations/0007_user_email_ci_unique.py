@@ -0,0 +1,45 @@
+from django.conf import settings
+from django.db import migrations
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+def check_duplicate_emails(apps, schema_editor):
+    # accounts created before emails were normalized (or through the admin/createsuperuser) can share
+    # an email that differs only by case; stop with the accounts to fix instead of a bare index error
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split('.'))
+    duplicates = (
+        User.objects.exclude(email='')
+        .values(email_ci=Lower('email'))
+        .annotate(count=Count('id'))
+        .filter(count__gt=1)
+        .values_list('email_ci', flat=True)
+    )
+    conflicts = []
+    for email in duplicates:
+        usernames = User.objects.filter(email__iexact=email).order_by('username').values_list('username', flat=True)
+        conflicts.append(f"{email}: {', '.join(usernames)}")
+    if conflicts:
+        raise RuntimeError(
+            "Cannot add the case-insensitive unique email index; these accounts share an email "
+            "(change or clear the email on all but one of each, then migrate again):\n  "
+            + "\n  ".join(conflicts)
+        )
+
+
+class Migration(migrations.Migration):
+    # auth.User belongs to django.contrib.auth, so the case-insensitive uniqueness of emails is
+    # enforced with a raw expression index (valid on both PostgreSQL and SQLite). Blank emails
+    # (e.g. users created with createsuperuser) are left out of the constraint.
+
+    dependencies = [
+        ('blog', '0006_lowercase_user_emails'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_duplicate_emails, migrations.RunPython.noop),
+        migrations.RunSQL(
+            "CREATE UNIQUE INDEX user_email_ci_unique ON auth_user (LOWER(email)) WHERE email <> ''",
+            reverse_sql="DROP INDEX user_email_ci_unique",
+        ),
+    ]
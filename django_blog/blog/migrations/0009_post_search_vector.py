@@ -0,0 +1,62 @@
+# Generated by Django 5.2.18 on 2026-10-15 04:42
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+SEARCH_INDEX = django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='post_search_vector_idx')
+
+# same document as the update_post_search_vector signal builds: title and tag names weighted A, content B
+BACKFILL_SQL = """
+UPDATE blog_post SET search_vector =
+    setweight(to_tsvector(COALESCE(title, '')), 'A')
+    || setweight(to_tsvector(COALESCE((
+        SELECT string_agg(t.name, ' ')
+        FROM taggit_tag t
+        JOIN taggit_taggeditem ti ON ti.tag_id = t.id
+        JOIN django_content_type ct ON ct.id = ti.content_type_id
+        WHERE ct.app_label = 'blog' AND ct.model = 'post' AND ti.object_id = blog_post.id
+    ), '')), 'A')
+    || setweight(to_tsvector(COALESCE(content, '')), 'B')
+"""
+
+
+# The GIN index and the tsvector backfill are only created here on PostgreSQL; on other databases
+# (e.g. SQLite in development) the column stays empty and search falls back to icontains.
+def add_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.add_index(apps.get_model('blog', 'Post'), SEARCH_INDEX)
+    schema_editor.execute(BACKFILL_SQL)
+
+
+# The index is in the model state on every database, so a later SQLite table rebuild recreates it
+# (as a plain index); drop it wherever it exists so the search_vector column can be removed.
+def remove_search_index(apps, schema_editor):
+    schema_editor.execute('DROP INDEX IF EXISTS %s' % schema_editor.quote_name(SEARCH_INDEX.name))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0008_post_ordering_indexes'),
+        ('taggit', '0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name='post', index=SEARCH_INDEX),
+            ],
+            database_operations=[
+                migrations.RunPython(add_search_index, remove_search_index),
+            ],
+        ),
+    ]
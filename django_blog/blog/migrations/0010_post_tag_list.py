@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-15 04:45
+
+from collections import defaultdict
+
+from django.db import migrations, models
+
+
+def fill_tag_list(apps, schema_editor):
+    # same format as the update_post_tag_list signal: [{'name': ..., 'slug': ...}] sorted by name
+    Post = apps.get_model('blog', 'Post')
+    TaggedItem = apps.get_model('taggit', 'TaggedItem')
+    tags = defaultdict(list)
+    tagged = TaggedItem.objects.filter(
+        content_type__app_label='blog', content_type__model='post',
+    ).order_by('tag__name').values_list('object_id', 'tag__name', 'tag__slug')
+    for post_id, name, slug in tagged:
+        tags[post_id].append({'name': name, 'slug': slug})
+    posts = list(Post.objects.filter(pk__in=tags).only('id'))
+    for post in posts:
+        post.tag_list = tags[post.pk]
+    Post.objects.bulk_update(posts, ['tag_list'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0009_post_search_vector'),
+        ('taggit', '0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx'),
+        ('contenttypes', '0002_remove_content_type_name'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='tag_list',
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+        migrations.RunPython(fill_tag_list, migrations.RunPython.noop),
+    ]
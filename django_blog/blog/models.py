@@ -1,7 +1,10 @@
 
 
-from django.db import models
+from django.db import connection, models
 from django.contrib.auth.models import User
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
+from django.core.cache import cache
 from taggit.managers import TaggableManager
 
 # Tag model for post tagging
@@ -19,7 +22,22 @@ class Post(models.Model):
     author = models.ForeignKey('auth.User', on_delete=models.CASCADE)
     updated_at = models.DateTimeField(auto_now=True)
     tags = TaggableManager()
+    # copy of the tags as [{'name': ..., 'slug': ...}] sorted by name, kept in sync by the
+    # update_post_tag_list signal, so list pages can show and link the tags without querying
+    # taggit's tables (a list rather than a joined string: tag names may contain commas)
+    tag_list = models.JSONField(default=list, blank=True, editable=False)
+    # full-text search document (title, content and tag names), kept up to date by the
+    # update_post_search_vector signal; only populated on PostgreSQL
+    search_vector = SearchVectorField(null=True, editable=False)
 
+    class Meta:
+        ordering = ['-published_date']
+        # the post list sorts by newest first, and an author's posts are looked up in the same order
+        indexes = [
+            models.Index(fields=['-published_date'], name='post_published_idx'),
+            models.Index(fields=['author', '-published_date'], name='post_author_published_idx'),
+            GinIndex(fields=['search_vector'], name='post_search_vector_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -28,6 +46,13 @@ class Post(models.Model):
         from django.urls import reverse
         return reverse('post_detail', kwargs={'pk': self.pk})
     
+# The cached post list fragments are keyed on this version number;
+# bumping it when a post or its tags change makes every cached page stale at once
+POST_LIST_CACHE_VERSION_KEY = 'posts:list:version'
+
+def get_post_list_cache_version():
+    return cache.get_or_set(POST_LIST_CACHE_VERSION_KEY, 1, None)
+
 # Profile model to extend User model with additional info
 class Profile(models.Model):
     # one-to-one relationship with User model since each user has one profile
@@ -38,18 +63,16 @@ class Profile(models.Model):
     def __str__(self):
         return f"{self.user.username} Profile"
 
-# Signal to auto-create or update Profile
-from django.db.models.signals import post_save
+# Signal to auto-create Profile
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 
 @receiver(post_save, sender=User)
-def create_or_update_user_profile(sender, instance, created, **kwargs):
+def create_user_profile(sender, instance, created, **kwargs):
+    # only on creation: re-saving the profile on every User.save() (e.g. the last_login
+    # bump on each login) was a wasted UPDATE; views.profile still creates one for legacy users
     if created:
         Profile.objects.create(user=instance)
-    else:
-        # Only save if profile exists
-        if hasattr(instance, 'profile'):    
-            instance.profile.save()
 
 # Comment model for blog posts
 class Comment(models.Model):
@@ -64,4 +87,40 @@ class Comment(models.Model):
         ordering = ['created_at']
 
     def __str__(self):
-        return f"Comment by {self.author.username} on {self.post.title}"
\ No newline at end of file
+        return f"Comment by {self.author.username} on {self.post.title}"
+
+# Signals to invalidate the cached post list when posts or their tags change
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(m2m_changed, sender=Post.tags.through)
+def invalidate_post_list_cache(sender, **kwargs):
+    try:
+        cache.incr(POST_LIST_CACHE_VERSION_KEY)
+    except ValueError:  # key missing or evicted
+        cache.set(POST_LIST_CACHE_VERSION_KEY, 1, None)
+
+# Signal to rebuild a post's search document when it is saved or its tags change
+@receiver(post_save, sender=Post)
+@receiver(m2m_changed, sender=Post.tags.through)
+def update_post_search_vector(sender, instance, action=None, **kwargs):
+    if connection.vendor != 'postgresql' or not isinstance(instance, Post):
+        return
+    if action not in (None, 'post_add', 'post_remove', 'post_clear'):
+        return
+    tag_names = ' '.join(instance.tags.names())
+    # update() does not send post_save, so this does not re-trigger itself
+    Post.objects.filter(pk=instance.pk).update(
+        search_vector=(
+            SearchVector('title', weight='A')
+            + SearchVector(models.Value(tag_names), weight='A')
+            + SearchVector('content', weight='B')
+        )
+    )
+
+# Signal to refresh the denormalized tag_list when a post's tags change
+@receiver(m2m_changed, sender=Post.tags.through)
+def update_post_tag_list(sender, instance, action, **kwargs):
+    if not isinstance(instance, Post) or action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    instance.tag_list = list(instance.tags.order_by('name').values('name', 'slug'))
+    Post.objects.filter(pk=instance.pk).update(tag_list=instance.tag_list)
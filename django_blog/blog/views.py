@@ -19,26 +19,37 @@ Permissions & Data Handling:
 See README.md for more details.
 """
 from asyncio.log import logger
+from functools import lru_cache
 from django.shortcuts import render, redirect, get_object_or_404
 from .forms import CustomUserCreationForm, PostForm, CommentForm, ReplyCommentForm
 from django.contrib.auth.decorators import login_required
 from django.views.generic import ListView, DetailView, CreateView
-from .models import Post, Profile, Comment
+from .models import Post, Profile, Comment, get_post_list_cache_version
 from django.contrib.auth.models import User
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.views.generic import UpdateView, DeleteView
-from django.urls import reverse_lazy
+from django.urls import reverse, reverse_lazy
 from django.contrib import messages
-from django.db.models import Q
+from django.core.paginator import Paginator
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F, Prefetch, Q
+from django.db.models.functions import Left
 
 def register(request):
     # URL: /register/
     if request.method == 'POST':
         form = CustomUserCreationForm(request.POST)
         if form.is_valid():
-            form.save()
-            messages.success(request, 'Account created successfully. You can now log in.')
-            return redirect('login')
+            # the database rejects a duplicate email in the same INSERT, so there is no check-then-insert race
+            try:
+                with transaction.atomic():
+                    form.save()
+            except IntegrityError:
+                form.add_error('email', "Registration failed. Please check your details and try again.")
+            else:
+                messages.success(request, 'Account created successfully. You can now log in.')
+                return redirect('login')
     else:
         messages.error(request, "Registration failed. Please check your details.")
         form = CustomUserCreationForm()
@@ -53,15 +64,26 @@ from .forms import UserUpdateForm, ProfileForm
 def profile(request):
     # URL: /profile/
     user = request.user
-    profile, created = Profile.objects.get_or_create(user=user)
+    # the post_save signal creates a profile for every new user; only users created
+    # before that signal existed can be missing one
+    try:
+        profile = user.profile
+    except Profile.DoesNotExist:
+        profile = Profile.objects.create(user=user)
     if request.method == 'POST':
         user_form = UserUpdateForm(request.POST, instance=user)
         profile_form = ProfileForm(request.POST, request.FILES, instance=profile)
         if user_form.is_valid() and profile_form.is_valid():
-            user_form.save()
-            profile_form.save()
-            messages.success(request, 'Your profile has been updated successfully.')
-            return redirect('profile')
+            # an email already used by another account is rejected by the user_email_ci_unique index
+            try:
+                with transaction.atomic():
+                    user_form.save()
+                    profile_form.save()
+            except IntegrityError:
+                user_form.add_error('email', "This email address cannot be used. Please choose another one.")
+            else:
+                messages.success(request, 'Your profile has been updated successfully.')
+                return redirect('profile')
     else:
         user_form = UserUpdateForm(instance=user)
         profile_form = ProfileForm(instance=profile)
@@ -72,6 +94,12 @@ def profile(request):
 
 # defining views for post management (create, edit, delete)
 
+# post detail URLs for the success redirects, memoized by pk; built from the comment's
+# post_id, the redirect also no longer loads the comment's Post just to call get_absolute_url()
+@lru_cache(maxsize=4096)
+def _post_url(pk):
+    return reverse('post_detail', kwargs={'pk': pk})
+
 
 
 # to restrict user actions based on login status and ownership of posts
@@ -91,7 +119,7 @@ class PostCreateView(LoginRequiredMixin, CreateView):
         return super().form_valid(form)
     
     def get_success_url(self):
-        return reverse_lazy('post_detail', kwargs={'pk': self.object.pk})
+        return _post_url(self.object.pk)
     
 # UserPassesTestMixin to ensure only authors can edit or delete their posts
 # custom permission logic in test_func method. when used we can define test_func method
@@ -103,6 +131,16 @@ class PostUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
     template_name = 'blog/post_form.html'
     success_url = reverse_lazy('home')
 
+    # the post is fetched once per request (test_func and UpdateView both ask for it), with its
+    # author for the ownership check and its tags for the form's initial tag string
+    def get_queryset(self):
+        return Post.objects.select_related('author').defer('search_vector').prefetch_related('tags')
+
+    def get_object(self, queryset=None):
+        if not hasattr(self, '_post'):
+            self._post = super().get_object(queryset)
+        return self._post
+
     # test_func to ensure only author can edit
     def test_func(self):
         post = self.get_object()
@@ -122,26 +160,61 @@ class PostDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
     # test_func to ensure only author can delete
     def test_func(self):
         post = self.get_object()
-        messages.success(self.request, 'Your post has been deleted successfully.')
         return self.request.user == post.author
+
+    # the success message is only added once the post is actually deleted
+    def form_valid(self, form):
+        response = super().form_valid(form)
+        messages.success(self.request, 'Your post has been deleted successfully.')
+        return response
     
+# characters of content fetched for the post list excerpts (comfortably more than 30 words)
+POST_EXCERPT_LENGTH = 500
+
 class PostListView(ListView):
     # URL: /posts/
     model = Post
     template_name = 'blog/home.html'
     context_object_name = 'posts'
-    ordering = ['-published_date']
     paginate_by = 5
 
+    # author is JOINed and tags are read from the denormalized tag_list, so the page is one query.
+    # only the columns home.html shows are loaded; the (possibly large) content is cut down to
+    # an excerpt in the database since the template truncates it to 30 words anyway
+    def get_queryset(self):
+        return (
+            Post.objects.select_related('author')
+            .only('id', 'title', 'published_date', 'tag_list', 'author__username')
+            .annotate(excerpt=Left('content', POST_EXCERPT_LENGTH))
+            .order_by('-published_date')
+        )
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        # home.html caches the rendered list per page under this version
+        context['post_list_cache_version'] = get_post_list_cache_version()
+        return context
+
+# comments rendered per page of a post's detail view
+COMMENTS_PER_PAGE = 50
+
 class PostDetailView(DetailView):
     # URL: /posts/<int:pk>/
     model = Post
     template_name = 'blog/post_detail.html'
     context_object_name = 'post'
 
+    # load the post with its author and tags up front
+    def get_queryset(self):
+        return Post.objects.select_related('author').defer('search_vector').prefetch_related('tags')
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['comments'] = self.object.comments.all()
+        # comments are shown a page at a time (?cpage=N), each page with its replies (and every
+        # author) prefetched, so the page renders in a fixed number of queries however popular the post is
+        replies = Comment.objects.select_related('author')
+        comments = self.object.comments.select_related('author').prefetch_related(Prefetch('replies', queryset=replies))
+        context['comments'] = Paginator(comments, COMMENTS_PER_PAGE).get_page(self.request.GET.get('cpage'))
         context['comment_form'] = CommentForm()
         context['tags'] = self.object.tags.all()
         return context
@@ -160,7 +233,7 @@ class CommentCreateView(LoginRequiredMixin, CreateView):
         return super().form_valid(form)
 
     def get_success_url(self):
-        return self.object.post.get_absolute_url()
+        return _post_url(self.object.post_id)
 
 class CommentUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
     model = Comment
@@ -172,7 +245,7 @@ class CommentUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
         return self.request.user == comment.author
 
     def get_success_url(self):
-        return self.object.post.get_absolute_url()
+        return _post_url(self.object.post_id)
 
 class CommentDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
     model = Comment
@@ -183,7 +256,7 @@ class CommentDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
         return self.request.user == comment.author
 
     def get_success_url(self):
-        return self.object.post.get_absolute_url()
+        return _post_url(self.object.post_id)
 
 class ReplyCommentCreateView(LoginRequiredMixin, CreateView):
     model = Comment
@@ -200,7 +273,7 @@ class ReplyCommentCreateView(LoginRequiredMixin, CreateView):
         return super().form_valid(form)
 
     def get_success_url(self):
-        return self.object.post.get_absolute_url()
+        return _post_url(self.object.post_id)
     
 
 # filter posts by tag
@@ -211,16 +284,30 @@ class PostByTagListView(ListView):
 
     def get_queryset(self):
         tag_slug = self.kwargs.get('tag_slug')
-        return Post.objects.filter(tags__slug=tag_slug)
+        return (
+            Post.objects.filter(tags__slug=tag_slug)
+            .select_related('author')
+            .only('id', 'title', 'published_date', 'author__username')
+        )
 
 # Search view for posts by title, content, or tags
 def search_posts(request):
     query = request.GET.get('q', '').strip().lower()
     results = []
-    if query:
+    if query and connection.vendor == 'postgresql':
+        # full-text match on the GIN-indexed search_vector, best matches first
+        search_query = SearchQuery(query)
+        results = (
+            Post.objects.filter(search_vector=search_query)
+            .annotate(rank=SearchRank(F('search_vector'), search_query))
+            .order_by('-rank', '-published_date')
+            .only('id', 'title', 'tag_list')
+        )
+    elif query:
+        # other databases (e.g. SQLite in development) have no search_vector; fall back to substring matching
         results = Post.objects.filter(
             Q(title__icontains=query) |
             Q(content__icontains=query) |
             Q(tags__name__icontains=query)
-        ).distinct()
+        ).distinct().only('id', 'title', 'tag_list')
     return render(request, 'blog/search_results.html', {'query': query, 'results': results})
\ No newline at end of file
@@ -94,6 +94,17 @@ DATABASES = {
     }
 }
 
+# Cache (used for the post list fragment): Redis when REDIS_URL is set, otherwise local memory
+REDIS_URL = os.getenv('REDIS_URL')
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': REDIS_URL,
+    } if REDIS_URL else {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -140,4 +151,11 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # setting static files
 STATIC_URL = 'static/'
 STATICFILES_DIRS = [BASE_DIR / 'static']
-STATIC_ROOT = BASE_DIR / 'staticfiles'
\ No newline at end of file
+STATIC_ROOT = BASE_DIR / 'staticfiles'
+# Upload limits, matched to the 2MB profile picture limit in ProfileForm.
+# Uploads up to that size stay in memory instead of being spooled to a temp file,
+# and a non-file request body over it is rejected (400) before the view runs.
+# Neither setting caps the size of an uploaded file itself: that is left to the
+# web server's request body limit, with ProfileForm's size check as the fallback.
+FILE_UPLOAD_MAX_MEMORY_SIZE = 2 * 1024 * 1024
+DATA_UPLOAD_MAX_MEMORY_SIZE = 2 * 1024 * 1024